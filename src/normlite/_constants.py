@@ -23,7 +23,6 @@ This module implements constants to be used in other modules of ``normlite``.
 
 """
 from enum import StrEnum
-import pdb
 
 from normlite.utils import normlite_deprecated
 
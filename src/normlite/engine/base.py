@@ -66,7 +66,6 @@ Here a quick example of how to use :class:`Engine` and :class:`Connection`.
 
 from __future__ import annotations
 from pathlib import Path
-import pdb
 from types import TracebackType
 from typing import Any, Mapping, Optional, Self, Sequence, Type, TypeAlias, TYPE_CHECKING, overload
 from dataclasses import dataclass
@@ -82,11 +81,11 @@ from normlite.sql.reflection import ReflectedColumnInfo
 from normlite.notion_sdk.client import FileBasedNotionClient, InMemoryNotionClient, NotionError
 from normlite.sql.compiler import NotionCompiler
 from normlite.notiondbapi.dbapi2 import Connection as DBAPIConnection, Cursor as DBAPICursor, Error, InternalError, ProgrammingError
-from normlite.utils import frozendict
+from normlite.utils import LRUCache, frozendict
 
 if TYPE_CHECKING:
     from normlite.sql.schema import Table, HasIdentifier
-    from normlite.sql.base import Executable
+    from normlite.sql.base import Executable, Compiled
     from normlite.engine.interfaces import _CoreAnyExecuteParams, IsolationLevel, CompiledCacheType, ExecutionOptions
 
 class Connection:
@@ -107,6 +106,8 @@ class Connection:
     
     """
 
+    __slots__ = ('_engine', '_execution_options')
+
     _execution_options: ExecutionOptions
     """The execution options for this connection."""
 
@@ -215,9 +216,8 @@ class Connection:
             execution_options: Mapping[str, Any]
     ) -> CursorResult:
 
-        # 1. compile the statement
-        compiler = self._engine._sql_compiler
-        compiled = elem.compile(compiler)
+        # 1. compile the statement (or reuse a previous compilation of it)
+        compiled = self._engine._compile(elem, self._execution_options)
 
         # 2. distill parameters
         distilled_params = _distill_params(parameters)  
@@ -569,6 +569,22 @@ class Engine:
         .. versionadded:: 0.7.0
         """
 
+        self._compiled_cache: CompiledCacheType = LRUCache(kwargs.get("compiled_cache_size", 1000))
+        """Default cache of the compiled DML statements, used unless the ``compiled_cache`` execution option is set.
+
+        It keeps the ``compiled_cache_size`` (default 1000) most recently used statements. 
+        Entries are keyed by the statement object and the identity signature of its tables at 
+        compile time. See :meth:`_compile`.
+
+        .. versionadded:: 0.13.0
+        """
+
+        self._inspector: Optional[Inspector] = None
+        """The inspector returned by :meth:`inspect`, created on first use.
+
+        .. versionadded:: 0.13.0
+        """
+
     @overload
     def execution_options(
         self,
@@ -976,10 +992,16 @@ class Engine:
 
         Factory method to procure :class:`Inspector` objects.
         
+        .. versionchanged:: 0.13.0
+            The inspector holds no state besides the engine, so the same object is returned on every call.
+
         .. versionadded:: 0.7.0
 
         """
-        return Inspector(self)
+        if self._inspector is None:
+            self._inspector = Inspector(self)
+
+        return self._inspector
     
     def connect(self) -> Connection:
         """Procure a new :class:`Connection` object.
@@ -1014,6 +1036,56 @@ class Engine:
     # Execution context management methods
     #----------------------------------------------------
 
+    def _compile(
+            self, 
+            elem: Executable, 
+            execution_options: Optional[Mapping[str, Any]] = None
+    ) -> Compiled:
+        """Compile the supplied statement, reusing the previous compilation of the same statement object.
+
+        DML statements are compiled once and then looked up in the cache given by the ``compiled_cache``
+        execution option, or in :attr:`_compiled_cache` if the option is not set. 
+        So executing the same statement object repeatedly (e.g. with different parameters in a loop) 
+        only binds the parameters again. Setting ``compiled_cache`` to ``None`` disables caching.
+        A cached entry is reused only if the object and data source ids of the statement's tables are
+        unchanged, since they are bound into the compiled payload.
+        DDL statements change those ids and are always compiled.
+
+        .. versionadded:: 0.13.0
+
+        Note:
+            The default cache is thread-safe, but the engine's compiler is not: a cached compiled object 
+            is shared by all executions of its statement and binds its parameters through the compiler. 
+            Statements must not be compiled or executed concurrently on the same engine.
+        """
+        if elem.is_ddl:
+            return elem.compile(self._sql_compiler)
+
+        if execution_options is not None and "compiled_cache" in execution_options:
+            cache = execution_options["compiled_cache"]
+            if cache is None:
+                return elem.compile(self._sql_compiler)
+        else:
+            cache = self._compiled_cache
+
+        key = (elem, self._compile_signature(elem))
+        compiled = cache.get(key)
+        if compiled is None:
+            compiled = elem.compile(self._sql_compiler)
+            cache[key] = compiled
+
+        return compiled
+
+    @staticmethod
+    def _compile_signature(elem: Executable) -> tuple:
+        """Return the identities of the tables the supplied DML statement is compiled against."""
+        tables = (getattr(elem, '_table', None), getattr(elem, '_right', None))
+        return tuple(
+            (table.get_oid(), table.get_data_source_id())
+            for table in tables
+            if table is not None
+        )
+
     def do_execute(
             self,
             cursor: DBAPICursor,
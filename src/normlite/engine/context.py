@@ -45,6 +45,7 @@ The design of SQL statement execution separates responsibilities cleanly using t
 """
 from __future__ import annotations
 from enum import Enum, auto
+import sys
 from typing import TYPE_CHECKING, Any, Mapping, Optional, Union, Sequence
 
 from normlite.exceptions import ArgumentError, StatementError
@@ -130,6 +131,13 @@ class ExecutionContext:
 
     """
 
+    __slots__ = (
+        'engine', 'connection', '_cursor', 'compiled', 'compiled_dict', 'invoked_stmt',
+        'execution_options', 'distilled_params', 'execution_style', 'path_params', 'query_params', 
+        'payload', 'resolved_params', '_result', '_rowcount', '_returned_primary_keys_rows', 
+        'bulk_operation', 'bulk_parameters', '_result_cursor', '_staged_result_cursor', '_join_execution',
+    )
+
     engine: Engine
     """Engine which the connection is associated with.
     
@@ -308,7 +316,7 @@ class ExecutionContext:
     .. versionadded:: 0.9.0
     """
 
-    _join_execution: Optional[JoinExecution] = None
+    _join_execution: Optional[JoinExecution]
     """The join-execution seam owning all join-domain state across both phases.
 
     Collapses the former five join-only context attributes (``_join``,
@@ -345,6 +353,7 @@ class ExecutionContext:
         self._result_cursor = None
         self._staged_result_cursor = None
         self.resolved_params: Optional[dict] = None
+        self._join_execution = None
 
     @property
     def cursor(self) -> Optional[DBAPICursor]:
@@ -396,6 +405,15 @@ class ExecutionContext:
             # user has provided a list of dictionaries as parameters to Connection.execute()
             return ExecutionStyle.INSERTMANYVALUES 
 
+        # the remaining cases depend on the statement only:
+        # classify it once per compiled object
+        style = self.compiled._execution_style
+        if style is None:
+            style = self.compiled._execution_style = self._classify_statement()
+
+        return style
+
+    def _classify_statement(self) -> ExecutionStyle:
         stmt = self.invoked_stmt
 
         # insert with multi parameters
@@ -511,8 +529,10 @@ class ExecutionContext:
             template = self.compiled_dict["payload"]
 
             if self.execution_style == ExecutionStyle.INSERTMANYVALUES:
+                # all rows share the template: look up its bind plan once
+                plan = self._get_bind_plan(template)
                 self.payload = [
-                    self._bind_params(template, param_set)
+                    self._apply_bind_plan(template, plan, param_set)
                     for param_set in resolved_params
                 ]
             else:
@@ -577,6 +597,10 @@ class ExecutionContext:
 
         Supports both single and multi-parameter execution.
         
+        .. versionchanged:: 0.13.0
+            It uses :meth:`normlite.sql.base.Compiled.construct_params` to resolve overrides against
+            the compiler state of the (possibly cached) compiled object.
+
         .. versionchanged: 0.9.0
             It uses :meth:`normlite.sql.compiler.NotionCompiler.construct_params` to resolve overrides.
 
@@ -589,25 +613,28 @@ class ExecutionContext:
 
         # resolve values
         for override in overrides:
-            resolved = self.compiled._compiler.construct_params(override)
+            resolved = self.compiled.construct_params(override)
             param_sets.append(resolved)
 
         # rebuild BindParameter objects
-        bind_template = self.compiled._compiler_state.execution_binds
+        bind_template = {
+            key: (template.type_, template.role)
+            for key, template in self.compiled._compiler_state.execution_binds.items()
+        }
         bound_param_sets = []
 
         for resolved in param_sets:
             bound = {}
 
             for key, value in resolved.items():
-                template = bind_template[key]
+                type_, role = bind_template[key]
 
                 bp = BindParameter(
                     key=key,
                     value=value,
-                    type_=template.type_,
+                    type_=type_,
                 )
-                bp.role = template.role
+                bp.role = role
 
                 bound[key] = bp
 
@@ -731,7 +758,7 @@ class ExecutionContext:
         if bindparam.role == _BindRole.COLUMN_FILTER:
             processor = type_.filter_value_processor()
         elif bindparam.role == _BindRole.COLUMN_VALUE:
-            processor = type_.bind_processor()
+            processor = type_._cached_bind_processor()
         elif bindparam.role == _BindRole.DBAPI_PARAM:
             processor = None
         else:
@@ -740,25 +767,48 @@ class ExecutionContext:
         return processor(raw) if processor else raw
      
     def _bind_params(self, template: dict, params: dict) -> dict:
-        """Helper for binding parameters at runtime."""
+        """Helper for binding parameters at runtime.
 
-        if isinstance(template, dict):
-            return {k: self._bind_params(v, params) for k, v in template.items()}
+        .. versionchanged:: 0.13.0
+            The placeholders of ``template`` are located once per compiled object (see :func:`_plan_placeholders`).
+            Binding copies only the containers leading to a placeholder, subtrees without placeholders
+            are shared with ``template`` and must not be mutated.
+        """
+        if not isinstance(template, (dict, list)):
+            if isinstance(template, str) and template.startswith(":"):
+                return self._resolve_bound_value(template[1:], params)
 
-        elif isinstance(template, list):
-            return [self._bind_params(item, params) for item in template]
+            # int, float, None …
+            return template
 
-        elif isinstance(template, str) and template.startswith(":"):
-            # parameter placeholder?
-            key = template[1:]
-            if key not in params:
-                raise KeyError(f"Missing parameter: {key}")
-            
-            bindparam = params.pop(key)
-            return self._resolve_bindparam(bindparam)
+        return self._apply_bind_plan(template, self._get_bind_plan(template), params)
+
+    def _apply_bind_plan(self, template: Union[dict, list], plan: tuple[tuple, tuple], params: dict) -> Union[dict, list]:
+        containers, placeholders = plan
+        copies = {(): _copy_container(template)}
+        for path, parent, step in containers:
+            node = copies[parent]
+            node[step] = copies[path] = _copy_container(node[step])
+
+        for parent, step, key in placeholders:
+            copies[parent][step] = self._resolve_bound_value(key, params)
+
+        return copies[()]
 
-        # int, float, None …
-        return template
+    def _resolve_bound_value(self, key: str, params: dict) -> Any:
+        if key not in params:
+            raise KeyError(f"Missing parameter: {key}")
+
+        bindparam = params.pop(key)
+        return self._resolve_bindparam(bindparam)
+
+    def _get_bind_plan(self, template: Union[dict, list]) -> tuple[tuple, tuple]:
+        plans = self.compiled._bind_plans
+        entry = plans.get(id(template))
+        if entry is None or entry[0] is not template:
+            entry = plans[id(template)] = (template, _plan_placeholders(template))
+
+        return entry[1]
         
     def setup_cursor_result(self, clear_buffered: bool = False) -> CursorResult:
         """Finalize execution and materialize a :class:`normlite.engine.cursor.CursorResult`.
@@ -836,3 +886,47 @@ class ExecutionContext:
         .. versionadded:: 0.9.0
         """
         return self._rowcount
+
+def _copy_container(node: Union[dict, list]) -> Union[dict, list]:
+    return dict(node) if isinstance(node, dict) else list(node)
+
+def _plan_placeholders(template: Union[dict, list]) -> tuple[tuple, tuple]:
+    """Locate the parameter placeholders in a compiled template.
+
+    The template is walked once. The plan consists of the containers to be copied,
+    as ``(path, parent_path, step)`` tuples ordered parents first, and of the placeholders, 
+    as ``(parent_path, step, key)`` tuples in template order. The keys are interned.
+
+    .. versionadded:: 0.13.0
+    """
+    containers = []
+    placeholders = []
+
+    def visit(node: Any, path: tuple) -> bool:
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            return False
+
+        found = False
+        for step, child in items:
+            if isinstance(child, str) and child.startswith(":"):
+                # intern the key: parameter keys are interned column names
+                placeholders.append((path, step, sys.intern(child[1:])))
+                found = True
+            elif isinstance(child, (dict, list)):
+                child_path = path + (step,)
+                mark = len(containers)
+                containers.append((child_path, path, step))
+                if visit(child, child_path):
+                    found = True
+                else:
+                    # drop the containers of a subtree without placeholders
+                    del containers[mark:]
+
+        return found
+
+    visit(template, ())
+    return tuple(containers), tuple(placeholders)
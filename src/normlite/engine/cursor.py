@@ -17,7 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
-import pdb
 from typing import Iterator, Optional, Sequence
 
 from normlite.engine.context import ExecutionContext
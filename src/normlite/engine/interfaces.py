@@ -17,12 +17,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional, Sequence, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, MutableMapping, Optional, Sequence, TypedDict, Union
 
 if TYPE_CHECKING:
     from normlite.sql.base import Compiled
 
-    CompiledCacheType = Mapping[Any, Compiled]
+    CompiledCacheType = MutableMapping[Any, Compiled]
 
 IsolationLevel = Literal[
     "SERIALIZABLE",
@@ -43,9 +43,11 @@ class ExecutionOptions(TypedDict, total=False):
     compiled_cache: Optional[CompiledCacheType]
     """Cache to re-use statement compilation object.
     
-    .. warning:: 
-        
-        Not supported yet. This option will be used in a later version.
+    Compiled DML statements are stored in and looked up from the supplied mapping. 
+    ``None`` disables caching. If not set, the engine's own LRU cache is used.
+
+    .. versionchanged:: 0.13.0
+        The option is honoured by :class:`normlite.engine.base.Connection`.
     """
     
     logging_token: str
@@ -121,6 +123,13 @@ _CoreAnyExecuteParams = Union[
 
 _DBAPISingleExecuteParams = Union[Sequence[Any], _CoreSingleExecuteParams]
 
+class _DistilledParams(list):
+    """A sequence of parameter mappings already validated by :func:`_distill_params`.
+
+    .. versionadded:: 0.13.0
+    """
+    __slots__ = ()
+
 def _distill_params(
     parameters: Optional[_CoreAnyExecuteParams] = None,
 ) -> _CoreMultiExecuteParams:
@@ -145,10 +154,18 @@ def _distill_params(
     
     Returns:
         _CoreMultiExecuteParams: Either a mapping or a sequence of mappings
+
+    .. versionchanged:: 0.13.0
+        ``None``, :class:`dict`, :class:`list` and :class:`tuple` parameters are dispatched by exact type 
+        before falling back to the slower :class:`collections.abc.Mapping` and :class:`collections.abc.Sequence` 
+        instance checks.
+        A validated sequence of mappings is returned as :class:`_DistilledParams`,
+        distilling it again returns it without walking its elements.
     """
 
-    if parameters is None:
-        return [{}]
+    distill = _DISTILL_BY_TYPE.get(type(parameters))
+    if distill is not None:
+        return distill(parameters)
 
     # Mapping = single execution
     if isinstance(parameters, Mapping):
@@ -156,19 +173,35 @@ def _distill_params(
 
     # Sequence = potentially executemany
     if isinstance(parameters, Sequence):
-        if not parameters:
-            # Empty sequence is just returned as is
-            return parameters
+        return _distill_sequence(parameters)
 
-        # Validate that all elements are mappings
+    raise TypeError(
+        "Execution parameters must be a mapping or a sequence of mappings"
+    )
+
+def _distill_sequence(parameters: _CoreMultiExecuteParams) -> _CoreMultiExecuteParams:
+    if not parameters:
+        # Empty sequence is just returned as is
+        return parameters
+
+    # Validate that all elements are mappings
+    if not all(type(param) is dict for param in parameters):
         for param in parameters:
             if not isinstance(param, Mapping):
                 raise TypeError(
                     "Each element of a multi-execute parameter sequence "
                     "must be a mapping"
                 )
-        return parameters
-
-    raise TypeError(
-        "Execution parameters must be a mapping or a sequence of mappings"
-    )
+    return _DistilledParams(parameters)
+
+_DISTILL_BY_TYPE: dict[type, Callable[[Any], _CoreMultiExecuteParams]] = {
+    type(None): lambda parameters: [{}],
+    dict: lambda parameters: [parameters],
+    list: _distill_sequence,
+    tuple: _distill_sequence,
+    _DistilledParams: lambda parameters: parameters,
+}
+"""Distillation of the common parameter types, looked up by exact type before the ABC checks.
+
+.. versionadded:: 0.13.0
+"""
@@ -1,4 +1,3 @@
-import pdb
 from typing import Any, Mapping, Sequence, Union
 from normlite._constants import SpecialColumns
 from normlite.engine.resultmetadata import CursorResultMetaData
@@ -20,6 +19,8 @@ class Row:
         and a mapping-sytle object to access the values of the columns returned in the row.
         
     """
+    __slots__ = ('_metadata', '_values')
+
     def __init__(self, metadata: CursorResultMetaData, row_data: tuple):
         self._metadata = metadata
         """The metadata object to process raw rows."""
@@ -34,18 +35,15 @@ class Row:
 
     
     def _process_dml_row(self, row_data: tuple) -> None:
-        for rec in self._metadata._colmap.values():
-            _, col_index, col_type = rec
-
-            type_factory = type_mapper[col_type]
-            result_proc = type_factory.result_processor()
-            value = row_data[col_index]
-            self._values[col_index] = result_proc(value)
+        values = self._values
+        for _, col_index, col_type in self._metadata._colmap.values():
+            result_proc = type_mapper[col_type]._cached_result_processor()
+            values[col_index] = result_proc(row_data[col_index])
     
     def _process_ddl_row(self, row_data: tuple) -> None:
         col_name, col_type, col_id, col_value, is_system = row_data
         type_factory = type_mapper[col_type]
-        result_proc = type_factory.result_processor()
+        result_proc = type_factory._cached_result_processor()
         self._values[0] = col_name
         self._values[1] = type_factory
         self._values[2] = col_id
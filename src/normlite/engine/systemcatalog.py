@@ -26,7 +26,6 @@ the current database.
 .. versionadded:: 0.8.0
 """
 from __future__ import annotations
-import pdb
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
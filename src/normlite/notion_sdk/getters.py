@@ -95,7 +95,7 @@ def rich_text_to_plain_text(rich_text: Iterable[Mapping[str, Any]]) -> str:
     for rt in rich_text:
         # 1. Primary: text.content (most stable)
         text = rt.get("text")
-        if isinstance(text, Mapping):
+        if type(text) is dict or isinstance(text, Mapping):
             content = text.get("content")
             if isinstance(content, str):
                 parts.append(content)
@@ -17,7 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
  
 from datetime import datetime
-import pdb
 from typing import Optional, TypedDict
 
 
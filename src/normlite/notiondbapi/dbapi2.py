@@ -142,6 +142,20 @@ class Cursor:
 
     """
 
+    __slots__ = (
+        '_connection',
+        '_errorhandler',
+        '_client',
+        '_result_sets',
+        '_result_index',
+        '_result_set',
+        '_paramstyle',
+        '_description',
+        '_closed',
+        'arraysize',
+        '_page_iter',
+    )
+
     _errorhandler: DBAPIErrorHandlerType
     """Read/write attribute which references an error handler to call in case an error condition is met.
     
@@ -356,12 +370,12 @@ class Cursor:
             return None       
         
         # extract the object UUID of the last row as 128-bit integer
-        last_inserted_rowids = rs.last_inserted_rowids
-        if last_inserted_rowids is None:
+        last_inserted_rowid = rs.last_inserted_rowid
+        if last_inserted_rowid is None:
             # no rows modified
             return None
         
-        return uuid.UUID(last_inserted_rowids[-1][0]).int
+        return uuid.UUID(last_inserted_rowid).int
     
     @property
     def lastrowid_as_string(self) -> Optional[str]:
@@ -369,13 +383,8 @@ class Cursor:
         if rs is None:
             return None       
         
-        # extract the object UUID of the last row as 128-bit integer
-        last_inserted_rowids = rs.last_inserted_rowids
-        if last_inserted_rowids is None:
-            # no rows modified
-            return None
-        
-        return last_inserted_rowids[-1][0]
+        # no rows modified yields None
+        return rs.last_inserted_rowid
     
     @property
     def _last_inserted_row_ids(self) -> Optional[list[tuple]]:
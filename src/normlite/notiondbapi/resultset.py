@@ -1,5 +1,6 @@
 from __future__ import annotations
 from operator import itemgetter
+import sys
 from typing import Optional
 
 from normlite._constants import SpecialColumns
@@ -60,13 +61,18 @@ class ResultSet:
             object_type = notion_obj["object"]
 
         rows = []
+        page_plan = None
 
         for obj in results:
             obj_type = obj["object"]
 
             if obj_type == "page":
                 object_type = obj_type
-                rows.append(cls._process_page(description, obj))
+                if page_plan is None:
+                    # all pages share the description: resolve the columns once
+                    page_plan = cls._plan_page_columns(description)
+
+                rows.append(cls._process_page(page_plan, obj))
 
             elif obj_type == "database":
                 object_type = obj_type
@@ -128,6 +134,17 @@ class ResultSet:
         # each entry in the result set provides ids
         return [(self._pg_oid_getter(r),) for r in self._rows]
 
+    @property
+    def last_inserted_rowid(self) -> Optional[str]:
+        """Return the object id of the last row, without collecting the ids of all rows.
+
+        .. versionadded:: 0.13.0
+        """
+        if self._object_type == "database" or not self._rows:
+            return None
+
+        return self._pg_oid_getter(self._rows[-1])
+
     def extend_from_json(self, notion_obj: dict) -> None:
         """Grow the current risult set with a new Notion result object.
 
@@ -140,27 +157,51 @@ class ResultSet:
         other = ResultSet.from_json(self._description, notion_obj)
         self._rows.extend(other._rows)
             
+    @classmethod
+    def _plan_page_columns(cls, description: tuple[tuple, ...]) -> tuple[tuple[str, bool], ...]:
+        """Resolve the description into ``(key, is_system)`` pairs.
+
+        System columns are mapped to their top-level key in the page object, 
+        user-defined columns to their property name.
+
+        .. versionadded:: 0.13.0
+        """
+        plan = []
+
+        for desc_entry in description:
+            col = desc_entry[0]
+
+            if col in SpecialColumns:
+                plan.append((_SYSTEM_COLUMNS_PAGE[col], True))
+            else:
+                plan.append((str(col), False))
+
+        return tuple(plan)
+
     @classmethod
     def _process_page(
         cls, 
-        description: tuple[tuple, ...],        
+        page_plan: tuple[tuple[str, bool], ...],        
         page: dict,
     ) -> tuple:
-        """Normalize a page object."""
+        """Normalize a page object.
+
+        .. versionchanged:: 0.13.0
+            The columns are passed as resolved by :meth:`_plan_page_columns`.
+        """
 
         row = []
         properties = page.get("properties", {})
 
-        for desc_entry in description:
-            col = desc_entry[0]
-
-            if col in SpecialColumns:
-                row.append(page.get(_SYSTEM_COLUMNS_PAGE[col]))
+        for key, is_system in page_plan:
+            if is_system:
+                row.append(page.get(key))
             else:
-                prop = properties.get(str(col))
+                prop = properties.get(key)
                 typ = prop.get("type")
+                # intern the type key: decoded JSON gives each page its own copy
                 row.append(
-                    {typ: prop[typ]}       # new contract as per issue [#290](https://github.com/giant0791/normlite/issues/290) 
+                    {sys.intern(typ): prop[typ]}       # new contract as per issue [#290](https://github.com/giant0791/normlite/issues/290) 
                     if typ else None
                 )
 
@@ -16,7 +16,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
-import pdb
 from typing import TYPE_CHECKING, Any
 import requests
 from requests.structures import CaseInsensitiveDict
@@ -16,7 +16,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import pdb
 from flask import Blueprint, request, jsonify
 
 from normlite.proxy.state import transaction_manager, notion
@@ -21,7 +21,6 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import wraps
 import json
-import pdb
 from typing import Any, ClassVar, NoReturn, Optional, Protocol, TYPE_CHECKING, Self, Sequence, overload
 import copy
 
@@ -67,6 +66,17 @@ class Visitable(ABC):
     __visit_name__: str
     """Class attribute used to denote the visit method to be called during compilation. """
 
+    _visit_fn_name: ClassVar[Optional[str]] = None
+    """The name of the compiler's visit method, derived from :attr:`__visit_name__` when the subclass is created.
+
+    .. versionadded:: 0.13.0
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        visit_name = getattr(cls, '__visit_name__', None)
+        cls._visit_fn_name = f"visit_{visit_name}" if visit_name else None
+
     def _compiler_dispatch(self, compiler: SQLCompiler, **kwargs: Any) -> dict:
         """Delegate this node's compilation to the compiler.
         
@@ -81,18 +91,21 @@ class Visitable(ABC):
 
         Returns:
             dict: The compilation result in form of a dictionary (JSON) object.
+
+        .. versionchanged:: 0.13.0
+            The visit method name is computed once per class instead of on every call.
         """
-        visit_name = getattr(self, '__visit_name__', None)
+        visit_fn_name = self._visit_fn_name
 
-        if not visit_name:
+        if visit_fn_name is None:
             raise UnsupportedCompilationError(
                 f"{self.__class__.__name__} is missing '__visit_name__' attribute."
             )
 
-        visit_fn = getattr(compiler, f"visit_{visit_name}", None)
+        visit_fn = getattr(compiler, visit_fn_name, None)
         if not callable(visit_fn):
             raise UnsupportedCompilationError(
-                f"{compiler.__class__.__name__} has no method visit_{visit_name}() "
+                f"{compiler.__class__.__name__} has no method {visit_fn_name}() "
                 f"for {self.__class__.__name__}"
             )
 
@@ -386,6 +399,18 @@ class Compiled:
 
         self._compiler_state = compiler._compiler_state
 
+        self._bind_plans: dict[int, tuple] = {}
+        """The placeholder plans of the templates in this compiled object, keyed by template id.
+
+        .. versionadded:: 0.13.0
+        """
+
+        self._execution_style = None
+        """The execution style implied by the compiled statement, set by the first execution context.
+
+        .. versionadded:: 0.13.0
+        """
+
     @property
     def string(self) -> str:
         """Provide a linted string of this compiled object."""
@@ -411,7 +436,7 @@ class Compiled:
                 ".params is not defined for bulk statements"
             )        
 
-        full = self._compiler.construct_params()
+        full = self.construct_params()
 
         return {
             key: value
@@ -419,6 +444,37 @@ class Compiled:
             if self._compiler_state.execution_binds[key].role == _BindRole.COLUMN_VALUE
         }
     
+    def construct_params(
+        self,
+        params: Optional[dict] = None,
+        group: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Return the bind params for this compiled object.
+
+        The compiler is shared by all statements compiled with it and only keeps the state of
+        the last compilation. This method runs :meth:`SQLCompiler.construct_params` against the
+        state of this compiled object, so that a compiled object can be executed again after 
+        other statements have been compiled.
+
+        .. versionadded:: 0.13.0
+
+        Args:
+            params (Optional[dict], optional): a dict of string/object pairs whose values will
+                override bind values compiled in to the statement. Defaults to None.
+            group (Optional[int], optional): The group number in a multi-parameter statement. 
+                Defaults to None.
+
+        Returns:
+            dict[str, Any]: The bind params for this compiled object.
+        """
+        compiler = self._compiler
+        prev_state = compiler._compiler_state
+        compiler._compiler_state = self._compiler_state
+        try:
+            return compiler.construct_params(params, group)
+        finally:
+            compiler._compiler_state = prev_state
+
     def as_dict(self) -> dict:
         """Return this compiled object in the original dictionary form."""
         return self._compiled
@@ -356,7 +356,7 @@ class NotionCompiler(SQLCompiler):
 
         # --- EXTRA KEYS VALIDATION ---
         if params:
-            extra_keys = set(params.keys()) - set(bindparams.keys())
+            extra_keys = params.keys() - bindparams.keys()
             if extra_keys:
                 err_msg = (
                     f"Unknown parameter(s): {extra_keys} (in parameter group {group})"
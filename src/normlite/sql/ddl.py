@@ -17,7 +17,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 from dataclasses import dataclass
-import pdb
 from typing import TYPE_CHECKING, Any, NoReturn, Optional
 import warnings
 
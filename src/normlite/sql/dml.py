@@ -960,13 +960,17 @@ class Update(ValuesBase):
         get_object_id = schema_for_result.column_getter("object_id")
         update_payload_template = context.compiled_dict['update_payload']
         bulk_params = []
+        properties = None
 
         for page in pages:
-            params_copy = dict(context.resolved_params)
-            properties = context._bind_params(update_payload_template, params_copy)
+            # the new values are the same for every page: bind them once,
+            # the client copies the property values it stores for each page
+            if properties is None:
+                properties = context._bind_params(update_payload_template, dict(context.resolved_params))
+
             bulk_params.append({
                 "path_params": {"page_id": get_object_id(page)},
-                "payload": {"properties": properties},
+                "payload": {"properties": dict(properties)},
             })
 
         context._staged_result_cursor = result_cursor
@@ -1149,7 +1153,7 @@ class JoinExecution:
 
                 
                 def sort_key(row: tuple[dict]) -> tuple[bool, Any]:
-                    result_processor = type_mapper[col.type_code].result_processor()
+                    result_processor = type_mapper[col.type_code]._cached_result_processor()
                     value = getter(row)
 
                     # result processor needs the property value
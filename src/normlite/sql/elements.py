@@ -18,7 +18,6 @@
 
 from __future__ import annotations
 from enum import Enum, auto
-import pdb
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
 
 from normlite.sql.base import ClauseElement
@@ -337,7 +337,7 @@ class Sort(VolcanoOperator):
                 col: ResultColumn = col, 
                 getter: Callable[[Sequence[Any]], Any] = getter
             ) -> tuple[bool, Any]:
-                value = type_mapper[col.type_code].result_processor()(getter(row))
+                value = type_mapper[col.type_code]._cached_result_processor()(getter(row))
 
                 # Empties-first/last sentinel, inherited from
                 # _extract_sort_value. For a right-side TITLE key this branch
@@ -17,7 +17,6 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
-import pdb
 from typing import Any, NamedTuple, Optional, Sequence
 from normlite._constants import SpecialColumns
 from normlite.notion_sdk import getters
@@ -105,22 +104,13 @@ class ReflectedTableInfo:
             ("column_name", "column_type", "column_id", "metadata", "is_system")
 
         Special columns carry table-level metadata via column_value.
-        """
-
-        columns: list[ReflectedColumnInfo] = []
 
-        for row in cols_as_tuples:
-            col_name, col_type, col_id, col_value, is_system = row
-            columns.append(
-                ReflectedColumnInfo(
-                    name=col_name,
-                    type=col_type,
-                    id=col_id,
-                    value=col_value,
-                    is_system=is_system
+        .. versionchanged:: 0.13.0
+            The column infos are built in one :func:`map` pass with :meth:`ReflectedColumnInfo._make`.
+        """
 
-                )
-            )
+        # tuple fields are in ReflectedColumnInfo field order
+        columns: list[ReflectedColumnInfo] = list(map(ReflectedColumnInfo._make, cols_as_tuples))
 
         # ---- validation (fail fast) ----
         # TODO: see https://github.com/giant0791/normlite/issues/248
@@ -58,8 +58,8 @@ You can inspect the table's primary key constraints by calling the :attr:`primar
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import itertools
-import pdb
 import re
+import sys
 from typing import Any, ClassVar, Dict, Iterable, Iterator, List, NoReturn, Optional, Set, Tuple, Union, overload, TYPE_CHECKING
 
 from normlite._constants import SpecialColumns
@@ -132,8 +132,13 @@ class Column(HasIdentifier, ColumnElement, ColumnOperators):
         primary_key: Optional[bool] = False
     ):
                 
-        self.name = name
-        """The column name. This must be unique within the same table."""
+        # sys.intern() rejects str subclasses, e.g. SpecialColumns members
+        self.name = sys.intern(name) if type(name) is str else name
+        """The column name. This must be unique within the same table.
+
+        .. versionchanged:: 0.13.0
+            Plain string names are interned, they are used as key in every bound payload and result row.
+        """
 
         self.type_ = type_
         """The column type as a concrete subclass of :class:`normlite.sql.type_api.TypeEngine`."""
@@ -461,6 +466,10 @@ class Table(HasIdentifier):
         # Always add system columns
         self._ensure_system_columns()
 
+        # direct references to the identity columns, read on every execution
+        self._oid_column: SystemColumn = self._sys_columns["object_id"]
+        self._dsid_column: SystemColumn = self._sys_columns["data_source_id"]
+
         # declarative columns
         if args:
             # add user-declared columns
@@ -590,10 +599,10 @@ class Table(HasIdentifier):
         return non_special_columns.as_readonly()
 
     def get_oid(self) -> str:
-        return self._sys_columns["object_id"]._value
+        return self._oid_column._value
     
     def get_data_source_id(self) -> Optional[str]:
-        return self._sys_columns["data_source_id"]._value
+        return self._dsid_column._value
 
     @normlite_deprecated("This method is deprecated and will be removed in a future version.")
     def set_oid(self, id_: str) -> None:
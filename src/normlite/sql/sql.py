@@ -59,7 +59,6 @@ Example usage of the cross-compiler :class:`SqlToJsonVisitor`:
 """
 
 from __future__ import annotations
-import pdb
 import re
 from enum import Enum, auto
 from typing import Any, Dict, List, Optional, Tuple, Iterator, Union
@@ -74,7 +74,6 @@ from typing import Optional, Union, Any, Dict, runtime_checkable
 from datetime import datetime, date, time, tzinfo
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from decimal import Decimal
-import pdb
 from types import MappingProxyType
 from typing import Any, Callable, List, Literal, NoReturn, Optional, Protocol, TypeAlias, Union, TYPE_CHECKING
 import uuid
@@ -128,6 +127,28 @@ class TypeEngine(Protocol):
     def filter_value_processor(self) -> Optional[Callable[[Any], Any]]:
         return None 
 
+    def _cached_bind_processor(self) -> Optional[Callable[[Any], Any]]:
+        """Return the :meth:`bind_processor()` of this type, creating it on first use.
+
+        .. versionadded:: 0.13.0
+        """
+        try:
+            return self.__dict__['_bind_processor']
+        except KeyError:
+            processor = self.__dict__['_bind_processor'] = self.bind_processor()
+            return processor
+
+    def _cached_result_processor(self) -> Optional[Callable[[Any], Any]]:
+        """Return the :meth:`result_processor()` of this type, creating it on first use.
+
+        .. versionadded:: 0.13.0
+        """
+        try:
+            return self.__dict__['_result_processor']
+        except KeyError:
+            processor = self.__dict__['_result_processor'] = self.result_processor()
+            return processor
+
     def get_col_spec(self) -> str:
         """Return a string for the SQL-like type name."""
         raise NotImplementedError
@@ -242,11 +263,13 @@ class Number(TypeEngine):
         }
 
     def bind_processor(self):
+        col_spec = self.get_col_spec()
+
         def process(value: Optional[Union[_NumericType, str]]) -> Optional[dict]:
             if value is None:
                 return None
             return {
-                self.get_col_spec(): 
+                col_spec: 
                 float(value) if isinstance(value, Decimal) 
                 else value
             }
@@ -389,10 +412,12 @@ class String(TypeEngine):
         """``True`` if it is a "title", ``False`` if it is a "richt_text"."""
 
     def bind_processor(self):
+        col_spec = self.get_col_spec()
+
         def process(value: Optional[str]) -> Optional[List[dict]]:
             if value is None:
                 return None
-            return {self.get_col_spec(): [{'text': {'content': str(value)}}]}
+            return {col_spec: [{'text': {'content': str(value)}}]}
         return process
         
     def result_processor(self):
@@ -444,13 +469,15 @@ class Boolean(TypeEngine):
         return "checkbox"
 
     def bind_processor(self):
+        col_spec = self.get_col_spec()
+
         def process(value: Optional[bool]) -> Optional[dict]:
             if value is None:
                 return None
             if isinstance(value, str):
                 # bind parameter: :is_active or :param_01
-                return {self.get_col_spec(): value}
-            return {self.get_col_spec(): bool(value)}
+                return {col_spec: value}
+            return {col_spec: bool(value)}
         return process
     
     def result_processor(self):
@@ -907,12 +934,14 @@ class Relation(TypeEngine):
         return DBAPITypeCode.RELATION
         
     def bind_processor(self):
+        col_spec = self.get_col_spec()
+
         def process(value: Union[list[str], None]) -> Optional[dict]:
             if value is None:
                 return None
             
             return {
-                self.get_col_spec(): [
+                col_spec: [
                     {
                         "id": page_id,
                     }
@@ -30,7 +30,6 @@ Warning:
 from __future__ import annotations
 from collections import defaultdict
 from enum import Enum, auto
-import pdb
 from typing import Any, Dict, List, Literal, Tuple
 import uuid
 
@@ -15,9 +15,11 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from typing import Iterator, Hashable, Any, Callable, TypeVar, ParamSpec
 import functools
+import threading
 import warnings
 
 P = ParamSpec("P")
@@ -157,3 +159,56 @@ class frozendict(Mapping):
         data = dict(self._data)
         data.update(updates)
         return frozendict(data)
+
+class LRUCache(MutableMapping):
+    """Mapping that keeps at most ``capacity`` entries, evicting the least recently used one.
+
+    Reading an entry marks it as most recently used. Lookups and inserts are guarded by a lock,
+    so the cache can be shared by threads.
+
+    .. versionadded:: 0.13.0
+    """
+    __slots__ = ("_data", "_capacity", "_lock")
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError(f"LRUCache capacity must be positive, got {capacity}")
+        self._data: OrderedDict = OrderedDict()
+        self._capacity = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of entries kept in the cache."""
+        return self._capacity
+
+    # ------------------------------------------------------------------
+    # MutableMapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._capacity:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"LRUCache(capacity={self._capacity}, size={len(self._data)})"
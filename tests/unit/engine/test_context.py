@@ -1,6 +1,5 @@
 from normlite import CursorResult
 from datetime import date
-import pdb
 import uuid
 import pytest
 
@@ -99,22 +98,24 @@ def create_students_db(engine: Engine) -> dict:
     return db
 
 
+def _student_page_payload(ds_id: str, name: str, sid: int) -> dict:
+    return {
+        'parent': {'type': 'data_source_id', 'data_source_id': ds_id},
+        'properties': {
+            'name': {'title': [{'text': {'content': name}}]},
+            'id': {'number': sid},
+            'is_active': {'checkbox': False},
+            'start_on': {'date': {'start': '1600-01-01'}},
+            'grade': {'rich_text': [{'text': {'content': 'A'}}]},
+        }
+    }
+
+
 def add_students_rows(engine: Engine, students: Table):
     ds_id = students.get_data_source_id()
 
     for name, sid in [("Galileo Galilei", 1500), ("Isaac Newton", 1600)]:
-        engine._client.pages_create(
-            payload={
-                'parent': {'type': 'data_source_id', 'data_source_id': ds_id},
-                'properties': {
-                    'name': {'title': [{'text': {'content': name}}]},
-                    'id': {'number': sid},
-                    'is_active': {'checkbox': False},
-                    'start_on': {'date': {'start': '1600-01-01'}},
-                    'grade': {'rich_text': [{'text': {'content': 'A'}}]},
-                }
-            }
-        )
+        engine._client.pages_create(payload=_student_page_payload(ds_id, name, sid))
 
 
 @pytest.fixture
@@ -191,6 +192,13 @@ def test_distill_params():
         _distill_params([{'a': 1}, 123])
 
 
+def test_distill_params_returns_distilled_sequence_as_is():
+    distilled = _distill_params([{'a': 1}, {'a': 2}])
+
+    assert distilled == [{'a': 1}, {'a': 2}]
+    assert _distill_params(distilled) is distilled
+
+
 def test_unused_bind_params_raises(engine, students):
     stmt = insert(students).values(name="A")
 
@@ -198,6 +206,19 @@ def test_unused_bind_params_raises(engine, students):
         run_context(engine, stmt, params={"unknown": 123})
 
 
+def test_bind_params_leaves_template_untouched(engine, students, students_db):
+    stmt = insert(students)
+    params = {"name": "Alice", "id": 123456, "is_active": True, "start_on": date(1999,1,1), "grade": "B"}
+
+    _, ctx = run_context(engine, stmt, params=params)
+    template = ctx.compiled_dict["payload"]
+
+    assert template["properties"]["name"] == ":name"
+    assert ctx.payload["properties"] is not template["properties"]
+    assert ctx.payload["properties"]["name"] != ":name"
+    assert id(template) in ctx.compiled._bind_plans
+
+
 def test_execution_style_delete(engine, populated_students, students):
     stmt = delete(students)
     _, ctx = run_context(engine, stmt)
@@ -1,5 +1,4 @@
 from datetime import datetime
-import pdb
 import pytest
 from normlite.engine.base import Engine
 from normlite.engine.context import ExecutionContext
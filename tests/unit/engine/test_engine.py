@@ -1,6 +1,5 @@
 from collections import namedtuple
 import json
-import pdb
 import pytest
 
 from normlite.engine.base import Engine, Inspector, NotionAuthURI, NotionURI, _parse_uri, NotionSimulatedURI, Connection, create_engine
@@ -440,4 +439,82 @@ def test_create_table_persists_table_dsid_in_catalog(engine: Engine, students: T
         table_catalog=engine._user_database_name,
     )
 
-    assert entry.table_dsid == students.get_data_source_id()
\ No newline at end of file
+    assert entry.table_dsid == students.get_data_source_id()
+
+
+# ---------------------------------------------------
+# Compiled statement cache
+# ---------------------------------------------------
+def test_reexecuting_statement_reuses_compiled(engine: Engine, students: Table, insert_values: dict):
+    students.create(bind=engine, checkfirst=True)
+    stmt = insert(students)
+
+    with engine.connect() as connection:
+        connection.execute(stmt, insert_values)
+        compiled = engine._compile(stmt)
+        connection.execute(stmt, {**insert_values, "name": "Isaac Newton"})
+        assert engine._compile(stmt) is compiled
+        assert len(engine._compiled_cache) == 1
+
+        rows = connection.execute(select(students)).all()
+
+    assert sorted(row.name for row in rows) == ["Galileo Galilei", "Isaac Newton"]
+
+def test_compiled_cache_recompiles_on_table_identity_change(engine: Engine, students: Table):
+    students.create(bind=engine, checkfirst=True)
+    stmt = select(students)
+
+    compiled = engine._compile(stmt)
+    assert engine._compile(stmt) is compiled
+    data_source_id = students.get_data_source_id()
+
+    # creating the table on another engine gives it new identities
+    other_engine = create_engine("normlite:///:memory:")
+    students.create(bind=other_engine)
+
+    assert students.get_data_source_id() != data_source_id
+    assert engine._compile(stmt) is not compiled
+
+def test_ddl_statements_are_not_cached(engine: Engine, students: Table):
+    students.create(bind=engine, checkfirst=True)
+
+    assert not any(elem.is_ddl for elem, _ in engine._compiled_cache)
+
+def test_compiled_cache_option_uses_supplied_mapping(engine: Engine, students: Table, insert_values: dict):
+    students.create(bind=engine, checkfirst=True)
+    stmt = insert(students)
+    cache = {}
+
+    with engine.connect() as connection:
+        connection.execution_options(compiled_cache=cache)
+        connection.execute(stmt, insert_values)
+        compiled = next(iter(cache.values()))
+        connection.execute(stmt, {**insert_values, "name": "Isaac Newton"})
+
+    assert list(cache.values()) == [compiled]
+    assert not engine._compiled_cache
+
+def test_compiled_cache_option_none_disables_caching(engine: Engine, students: Table, insert_values: dict):
+    students.create(bind=engine, checkfirst=True)
+    stmt = insert(students)
+
+    with engine.connect() as connection:
+        connection.execution_options(compiled_cache=None)
+        connection.execute(stmt, insert_values)
+        rows = connection.execute(select(students)).all()
+
+    assert [row.name for row in rows] == ["Galileo Galilei"]
+    assert not engine._compiled_cache
+    assert engine._compile(stmt, {"compiled_cache": None}) is not engine._compile(stmt, {"compiled_cache": None})
+
+def test_compiled_cache_size_limits_default_cache(students: Table):
+    engine = create_engine("normlite:///:memory:", compiled_cache_size=1)
+    students.create(bind=engine)
+
+    stmt = select(students)
+
+    first = engine._compile(stmt)
+    engine._compile(insert(students))
+
+    assert len(engine._compiled_cache) == 1
+    assert engine._compile(stmt) is not first
@@ -1,4 +1,3 @@
-import pdb
 
 from faker import Faker
 import pytest
@@ -1,4 +1,3 @@
-import pdb
 import pytest
 
 from normlite.engine.base import Engine, create_engine
@@ -1,8 +1,7 @@
-import pdb
 import uuid
 import pytest
 
-from normlite.notion_sdk.client import InMemoryNotionClient, NotionError
+from normlite.notion_sdk.client import InMemoryNotionClient, NotionError, _clone_json
 from normlite.notion_sdk.getters import (
     get_object_type,
     get_title,
@@ -1029,6 +1028,28 @@ def test_pages_update_properties(client):
         == "Updated"
     )
 
+def test_pages_update_stores_copies_of_property_values(client):
+    pages = [
+        client.pages_create(payload=make_title_page(client._ROOT_PAGE_ID_))
+        for _ in range(2)
+    ]
+    properties = {
+        "Title": {"title": [{"text": {"content": "Updated"}}]},
+        "Tags": {"multi_select": [{"name": "physics"}]},
+    }
+
+    for page in pages:
+        client.pages_update(
+            path_params={"page_id": page["id"]},
+            payload={"properties": dict(properties)},
+        )
+    properties["Tags"]["multi_select"].append({"name": "math"})
+
+    first, second = (client._get_by_id(page["id"]) for page in pages)
+    assert first["properties"]["Tags"]["multi_select"] == [{"name": "physics"}]
+    assert first["properties"]["Tags"] is not second["properties"]["Tags"]
+    assert first["properties"]["Title"]["title"] is not second["properties"]["Title"]["title"]
+
 def test_pages_update_in_trash_flag(client):
     page = client.pages_create(
         payload=make_title_page(client._ROOT_PAGE_ID_)
@@ -1952,4 +1973,20 @@ def test_databases_query_endpoint_is_retired(client: InMemoryNotionClient):
     dispatching to it raises rather than silently returning an (empty) result set.
     """
     with pytest.raises(NotionError, match="Unknown or unsupported operation"):
-        client("databases", "query", path_params={"database_id": "some-db-id"})
\ No newline at end of file
+        client("databases", "query", path_params={"database_id": "some-db-id"})
+
+
+def test_clone_json_copies_containers_only():
+    from decimal import Decimal
+
+    title = [{"text": {"content": "Title"}}]
+    obj = {"title": title, "again": title, "number": Decimal("1.5"), "flag": None}
+
+    clone = _clone_json(obj)
+
+    assert clone == obj
+    assert clone["title"] is not title
+    assert clone["title"][0] is not title[0]
+    # shared subtrees are copied independently
+    assert clone["again"] is not clone["title"]
+    assert clone["number"] == Decimal("1.5")
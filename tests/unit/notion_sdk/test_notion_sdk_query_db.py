@@ -1,4 +1,3 @@
-import pdb
 import pytest
 
 from normlite.notion_sdk.client import _LogicalCondition, _Condition, _Filter
@@ -1,5 +1,4 @@
 from operator import itemgetter
-import pdb
 import uuid
 
 import pytest
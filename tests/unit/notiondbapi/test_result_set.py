@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from operator import itemgetter
 import json
-import pdb
 from typing import Any, Callable, Sequence
 
 import pytest
@@ -461,6 +460,14 @@ def test_resultset_fetchall(prefilled_client: InMemoryNotionClient, data_source_
 
     assert ["Galileo Galilei", "Isaac Newton", "Ada Lovelace"] == all
 
+def test_plan_page_columns_resolves_description(row_description: tuple[tuple, ...]):
+    plan = ResultSet._plan_page_columns(row_description)
+
+    assert plan[0] == ("id", True)
+    assert plan[3] == ("created_time", True)
+    assert plan[4] == ("name", False)
+    assert len(plan) == len(row_description)
+
 def test_resultset_database_from_json(
     prefilled_client: InMemoryNotionClient, 
     row_description: tuple[tuple, ...],
@@ -569,6 +576,7 @@ def test_resultset_last_inserted_rowids_from_pages(
     resultset = ResultSet.from_json(row_description, results)
 
     assert len(resultset.last_inserted_rowids) == len(resultset)    
+    assert resultset.last_inserted_rowid == resultset.last_inserted_rowids[-1][0]
 
 def test_resultset_last_inserted_rowids_from_database(prefilled_client: InMemoryNotionClient, database_id: str):
     database = prefilled_client.databases_retrieve(
@@ -579,6 +587,7 @@ def test_resultset_last_inserted_rowids_from_database(prefilled_client: InMemory
     resultset = ResultSet.from_json(description=None, notion_obj=database)
 
     assert resultset.last_inserted_rowids is None
+    assert resultset.last_inserted_rowid is None
 
 def test_rs_real_life_db_notion_object_creates_desc(database_retrieved):
     rs = ResultSet.from_json(description=None, notion_obj=database_retrieved)
@@ -1,4 +1,3 @@
-import pdb
 from types import MappingProxyType
 
 import pytest
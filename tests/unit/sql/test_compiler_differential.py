@@ -3,7 +3,6 @@ from decimal import Decimal
 from tqdm import tqdm
 
 import pytest
-import pdb
 import statistics
 
 from normlite.sql.base import _CompileState, CompilerState
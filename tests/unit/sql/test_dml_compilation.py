@@ -9,7 +9,6 @@ Note:
 """
 from datetime import datetime, date
 import uuid
-import pdb
 import pytest
 
 from normlite.engine.base import Connection, Engine, create_engine
@@ -1,5 +1,4 @@
 import json
-import pdb
 from collections import Counter
 import pytest
 from tqdm import tqdm
@@ -1,5 +1,4 @@
 import json
-import pdb
 import uuid
 
 import pytest
@@ -1,7 +1,6 @@
 from tqdm import tqdm
 
 import pytest
-import pdb
 
 from normlite.sql.elements import (
     BindParameter,
@@ -14,6 +13,7 @@ from normlite.sql.elements import (
     not_
 )
 from normlite.sql.schema import Column
+from normlite.sql.type_api import String
 from tests.utils.ast_equal import ast_equal
 from tests.utils.exec_utils import exec_expression
 from tests.utils.generators import ASTGenerator, EntityRandomGenerator, ExpressionGenerator
@@ -77,7 +77,7 @@ def test_exprgen_parentheses_safety():
         namespace[gen_table.name] = gen_table
 
         try:
-            result = exec_expression(expr_src, namespace)
+            result = exec_expression(expr_src, namespace, copy_namespace=True)
         except Exception as e:
             pytest.fail(f"Illegal expression:\n{expr_src}\n{e}")
 
@@ -103,6 +103,9 @@ def test_ast_and_expr_generators_compatible():
     assert isinstance(ast_expr, ColumnElement)
     assert isinstance(expr_expr, ColumnElement)
 
+def test_ast_equal_columns_without_table_are_unequal():
+    assert not ast_equal(Column("grade", String()), Column("grade", String()))
+
 # ------------------------------------------------------------
 # Failure payload
 # ------------------------------------------------------------
@@ -252,7 +255,7 @@ def test_pycompiler_roundtrip_massive(astgen: ASTGenerator):
         # --------------------------------------------------
         # 3. Execute Python → AST
         # --------------------------------------------------
-        reconstructed = exec_expression(source, namespace)
+        reconstructed = exec_expression(source, namespace, copy_namespace=True)
 
         # --------------------------------------------------
         # 4. Structural equality
@@ -1,5 +1,4 @@
 import json
-import pdb
 import pytest
 
 from normlite._constants import SpecialColumns
@@ -1,5 +1,5 @@
 from __future__ import annotations
-import pdb
+import sys
 from typing import Iterable
 from unittest.mock import Mock, patch
 import pytest
@@ -766,6 +766,17 @@ def test_column_rejects_unknown_positional_arg():
     with pytest.raises(ArgumentError, match="ForeignKey"):
         Column("students_oid", Relation(), "not-a-fk")
 
+def test_column_accepts_strenum_name():
+    col = Column(SpecialColumns.NO_ID, Integer())
+
+    assert col.name is SpecialColumns.NO_ID
+    assert col.name == "object_id"
+
+def test_column_interns_plain_str_name():
+    col = Column("".join(["grade", "_level"]), Integer())
+
+    assert col.name is sys.intern("grade_level")
+
 def test_table_autowires_foreignkey_constraint_on_create(engine: Engine):
     from normlite import Relation
 
@@ -1,6 +1,5 @@
 from datetime import date, datetime
 import itertools
-import pdb
 import uuid
 from zoneinfo import ZoneInfo
 import pytest
@@ -1,7 +1,6 @@
 
 from datetime import date, datetime
 from decimal import Decimal
-import pdb
 from zoneinfo import ZoneInfo
 
 import pytest
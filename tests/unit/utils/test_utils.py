@@ -1,7 +1,7 @@
 import pytest
 from collections.abc import Mapping
 
-from normlite.utils import frozendict, normlite_deprecated
+from normlite.utils import LRUCache, frozendict, normlite_deprecated
 # adjust import path as needed
 
 
@@ -232,4 +232,21 @@ def test_deprecated_util():
         pass
 
     with pytest.warns(DeprecationWarning, match="other API"):
-        old_api()
\ No newline at end of file
+        old_api()
+# ---------------------------------------------------------------------
+# LRU cache
+# ---------------------------------------------------------------------
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+
+def test_lru_cache_rejects_non_positive_capacity():
+    with pytest.raises(ValueError, match="capacity"):
+        LRUCache(0)
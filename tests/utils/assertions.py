@@ -1,5 +1,9 @@
 from datetime import datetime
-import uuid
+import re
+
+_CANONICAL_UUID4 = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
+)
 
 def assert_no_rows(result) -> None:
     """
@@ -59,14 +63,8 @@ def assert_is_today(date_as_iso: str):
     assert is_today(date_as_iso)
     
 def is_valid_uuid4(uuid_string):
-    try:
-        # If the string is not a valid UUIDv4, this will raise a ValueError
-        val = uuid.UUID(uuid_string, version=4)
-    except ValueError:
-        return False
-    
-    # Optional: Ensure the string is in the standard canonical form
-    return str(val) == uuid_string
+    # Accept the standard canonical form of a UUIDv4 only
+    return isinstance(uuid_string, str) and _CANONICAL_UUID4.fullmatch(uuid_string) is not None
 
 def assert_is_valid_uuid4(uuuid_string):
     assert is_valid_uuid4(uuuid_string)
\ No newline at end of file
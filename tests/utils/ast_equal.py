@@ -17,6 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from normlite.sql.elements import BinaryExpression, BindParameter, BooleanClauseList, ColumnElement, UnaryExpression
+from normlite.sql.schema import Column
 
 def ast_equal(a: ColumnElement, b: ColumnElement) -> bool:
     """Return ``True`` if the two ASTs are equal.
@@ -52,11 +53,15 @@ def ast_equal(a: ColumnElement, b: ColumnElement) -> bool:
     except KeyError:
         raise NotImplementedError(f"No equality defined for {type(a).__name__}")
 
-def _eq_Column(a: ColumnElement, b: ColumnElement) -> bool:
-    return (
-        a.name == b.name
-        and a.table.name == b.table.name
-    )
+def _eq_Column(a: Column, b: Column) -> bool:
+    if a.name != b.name:
+        return False
+
+    if a.parent is None or b.parent is None:
+        # a column without a table cannot be matched by name alone
+        return False
+
+    return a.parent is b.parent or a.parent.name == b.parent.name
 
 def _eq_BindParameter(a: BindParameter, b: BindParameter) -> bool:
     if a.callable_ is not None or b.callable_ is not None:
@@ -88,8 +93,9 @@ def _eq_BooleanClauseList(a: BooleanClauseList, b: BooleanClauseList) -> bool:
     if len(a.clauses) != len(b.clauses):
         return False
 
-    return all(
-        ast_equal(x, y)
-        for x, y in zip(a.clauses, b.clauses)
-    )
+    for x, y in zip(a.clauses, b.clauses):
+        if not ast_equal(x, y):
+            return False
+
+    return True
 
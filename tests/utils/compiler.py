@@ -2,7 +2,6 @@ from datetime import date
 from decimal import Decimal
 import json
 import difflib
-import pdb
 from typing import Callable, NoReturn
 
 from normlite.sql.elements import BinaryExpression, BindParameter, BooleanClauseList, ColumnElement, Operator, UnaryExpression
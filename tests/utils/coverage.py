@@ -18,15 +18,31 @@
 
 from collections import defaultdict
 import math
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Iterator
+
+from tests.utils.generators import ReferenceGenerator
 
 
 class CoverageCounter:
-    def __init__(self):
-        self._counts = defaultdict(int)
+    """Hit counter for one coverage axis.
+
+    Keys known up front are counted in a flat list indexed by the position of the key,
+    any other key falls back to a :class:`collections.defaultdict`.
+    Only keys hit at least once are reported.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._keys = tuple(keys)
+        self._index = {key: i for i, key in enumerate(self._keys)}
+        self._arr = [0] * len(self._keys)
+        self._extra = defaultdict(int)
 
     def hit(self, key: str):
-        self._counts[key] += 1
+        i = self._index.get(key)
+        if i is None:
+            self._extra[key] += 1
+        else:
+            self._arr[i] += 1
 
     def update(self, keys: Iterable[str]):
         for k in keys:
@@ -34,11 +50,24 @@ class CoverageCounter:
 
     @property
     def counts(self) -> Dict[str, int]:
-        return dict(self._counts)
+        return dict(self._hits())
+
+    def iter_sorted(self) -> Iterator[tuple[str, int]]:
+        """Iterate over the keys hit and their counts, sorted by key."""
+        return iter(sorted(self._hits()))
 
     def describe(self) -> dict:
-        values = list(self._counts.values())
+        return self._describe([n for _, n in self._hits()])
+
+    def _hits(self) -> Iterator[tuple[str, int]]:
+        for key, n in zip(self._keys, self._arr):
+            if n:
+                yield key, n
 
+        yield from self._extra.items()
+
+    @staticmethod
+    def _describe(values: list[int]) -> dict:
         if not values:
             return {
                 "count": 0,
@@ -68,9 +97,9 @@ class CoverageCounter:
 
 class CoverageRegistry:
     def __init__(self):
-        self.types = CoverageCounter()
-        self.operators = CoverageCounter()
-        self.logical_nodes = CoverageCounter()
+        self.types = CoverageCounter(sorted(ReferenceGenerator.TYPES))
+        self.operators = CoverageCounter(sorted(set().union(*ReferenceGenerator.OPERATORS.values())))
+        self.logical_nodes = CoverageCounter(("and", "or", "not"))
         self.schemas = CoverageCounter()
 
     def report(self) -> dict:
@@ -83,12 +112,19 @@ class CoverageRegistry:
 
     def pretty_print(self):
         def section(title, counter):
+            items, description = self._summarize(counter)
             print(f"\n== {title} ==")
-            for k, v in sorted(counter.counts.items()):
+            for k, v in items:
                 print(f"{k:20} {v}")
-            print("describe:", counter.describe())
+            print("describe:", description)
 
         section("Types", self.types)
         section("Operators", self.operators)
         section("Logical nodes", self.logical_nodes)
         section("Schemas", self.schemas)
+
+    @staticmethod
+    def _summarize(counter: CoverageCounter) -> tuple[list[tuple[str, int]], dict]:
+        """Return the sorted hits of ``counter`` and their description in one pass."""
+        items = list(counter.iter_sorted())
+        return items, counter._describe([n for _, n in items])
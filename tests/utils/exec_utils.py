@@ -21,17 +21,30 @@ from datetime import date
 from decimal import Decimal
 from normlite.sql.elements import ColumnElement, and_, or_, not_
 
-def exec_expression(source: str, namespace: dict) -> ColumnElement:
-    globals_ = {
-        "__builtins__": {},
-        "date": date,               # datetime.date
-        "datetime": datetime,       # datetime MODULE
-        "Decimal": Decimal,
-        "and_": and_,
-        "or_": or_,
-        "not_": not_,
+_SHARED_GLOBALS = {
+    "__builtins__": {},
+    "date": date,               # datetime.date
+    "datetime": datetime,       # datetime MODULE
+    "Decimal": Decimal,
+    "and_": and_,
+    "or_": or_,
+    "not_": not_,
 
-    }
-    locals_ = dict(namespace)
-    exec(f"result = ({source})", globals_, locals_)
+}
+
+def exec_expression(source: str, namespace: dict, *, copy_namespace: bool = False) -> ColumnElement:
+    """Execute a generated Python expression and return the resulting AST.
+
+    Args:
+        source (str): The Python expression source.
+        namespace (dict): The names visible to the expression, typically the generated tables.
+        copy_namespace (bool, optional): Execute against a copy of ``namespace``. 
+            Pass ``True`` when ``namespace`` is reused across calls, because the expression
+            result is stored in it under the ``"result"`` key. Defaults to ``False``.
+
+    Returns:
+        ColumnElement: The AST produced by the expression.
+    """
+    locals_ = dict(namespace) if copy_namespace else namespace
+    exec(f"result = ({source})", _SHARED_GLOBALS, locals_)
     return locals_["result"]
\ No newline at end of file
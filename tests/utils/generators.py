@@ -20,7 +20,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import random
-from typing import Any, Generic, Protocol, Sequence, TypeVar, List, Literal
+import threading
+from typing import Any, Callable, Generic, Protocol, Sequence, TypeVar, List, Literal
 
 from faker import Faker
 from decimal import Decimal
@@ -49,6 +50,32 @@ T = TypeVar("T")
 
 BoolOp = Literal["and", "or"]
 
+Fragments = list["str | Fragments"]
+"""Nested source fragments emitted by :class:`ExpressionGenerator`."""
+
+
+# ------------------------------------------------------------------------------
+# Shared Faker
+# ------------------------------------------------------------------------------
+
+_faker_local = threading.local()
+
+def _shared_faker(seed: int | None = None) -> Faker:
+    """Return the :class:`Faker` instance shared by all generators of the calling thread.
+
+    Creating a :class:`Faker` loads all its providers, so generators reuse one instance per thread.
+    Seeding a generator reseeds the shared instance: Interleaving draws from two generators
+    created with a seed gives different values than using them one after the other.
+    """
+    faker = getattr(_faker_local, "faker", None)
+    if faker is None:
+        faker = _faker_local.faker = Faker()
+
+    if seed is not None:
+        faker.seed_instance(seed)
+
+    return faker
+
 
 # ------------------------------------------------------------------------------
 # Reference workload generator for filters and pages
@@ -125,13 +152,15 @@ class ReferenceGenerator:
 
     def __init__(self, seed: int | None = None):
         self.rng = random.Random(seed)
-        self.faker = Faker()
-        if seed is not None:
-            self.faker.seed_instance(seed)
+        self.faker = _shared_faker(seed)
 
         self.metadata = MetaData()
         self._relation_id_pool: list[str] = []
 
+        # Property names of the last schema seen by gen_condition()
+        self._keys_schema: dict | None = None
+        self._keys: tuple[str, ...] = ()
+
     def gen_schema(self, min_props=1, max_props=6) -> dict:
         schema = {}
         n = self.rng.randint(min_props, max_props)
@@ -160,71 +189,87 @@ class ReferenceGenerator:
         }
 
     def _gen_property_value(self, typ: str) -> dict:
-        if typ in ("title", "rich_text"):
-            return {
-                "type": typ,
-                typ: [{
-                    "text": {
-                        "content": self.faker.name()
-                    }
-                }]
-            }
+        gen = self._PROPERTY_VALUE_GENERATORS.get(typ)
+        if gen is None:
+            raise ValueError(f"Unsupported property type: {typ}")
 
-        if typ == "number":
-            return {
-                "type": "number",
-                "number": self.rng.randint(0, 1000)
-            }
+        return gen(self, typ)
 
-        if typ == "number_with_commas":
-            return {
-                "type": "number",
-                "number": self.faker.pydecimal(
-                    left_digits=4,
-                    right_digits=3,
-                    min_value=-9999.999,
-                    max_value=9999.999
-                )
-            }
-        
-        if typ == "dollar":
-            return {
-                "type": "number",
-                "number": Decimal(self.rng.randint(-9999, 9999)) / 100
-            }
+    def _gen_text_value(self, typ: str) -> dict:
+        return {
+            "type": typ,
+            typ: [{
+                "text": {
+                    "content": self.faker.name()
+                }
+            }]
+        }
 
-        if typ == "checkbox":
-            return {
-                "type": "checkbox",
-                "checkbox": self.rng.choice([True, False])
-            }
+    def _gen_number_value(self, typ: str) -> dict:
+        return {
+            "type": "number",
+            "number": self.rng.randint(0, 1000)
+        }
 
-        if typ == "date":
-            if self.rng.random() < 0.2:
-                return {
-                    "type": "date",
-                    "date": {}
-                }
+    def _gen_number_with_commas_value(self, typ: str) -> dict:
+        return {
+            "type": "number",
+            "number": self.faker.pydecimal(
+                left_digits=4,
+                right_digits=3,
+                min_value=-9999.999,
+                max_value=9999.999
+            )
+        }
 
+    def _gen_dollar_value(self, typ: str) -> dict:
+        return {
+            "type": "number",
+            "number": Decimal(self.rng.randint(-9999, 9999)) / 100
+        }
+
+    def _gen_checkbox_value(self, typ: str) -> dict:
+        return {
+            "type": "checkbox",
+            "checkbox": self.rng.choice([True, False])
+        }
+
+    def _gen_date_value(self, typ: str) -> dict:
+        if self.rng.random() < 0.2:
             return {
                 "type": "date",
-                "date": {
-                    "start": self._gen_iso_date(),
-                    "end": None
-                }
+                "date": {}
             }
-        
-        if typ == "relation":
-            k = self.rng.randint(0, 3)
-            return {
-                "type": "relation",
-                "relation": [
-                    {"id": id_} 
-                    for id_ in self.rng.sample(self._relation_id_pool, k)
-                ],
+
+        return {
+            "type": "date",
+            "date": {
+                "start": self._gen_iso_date(),
+                "end": None
             }
+        }
 
-        raise ValueError(f"Unsupported property type: {typ}")
+    def _gen_relation_value(self, typ: str) -> dict:
+        k = self.rng.randint(0, 3)
+        return {
+            "type": "relation",
+            "relation": [
+                {"id": id_} 
+                for id_ in self.rng.sample(self._relation_id_pool, k)
+            ],
+        }
+
+    _PROPERTY_VALUE_GENERATORS: dict[str, Callable[[ReferenceGenerator, str], dict]] = {
+        "title": _gen_text_value,
+        "rich_text": _gen_text_value,
+        "number": _gen_number_value,
+        "number_with_commas": _gen_number_with_commas_value,
+        "dollar": _gen_dollar_value,
+        "checkbox": _gen_checkbox_value,
+        "date": _gen_date_value,
+        "relation": _gen_relation_value,
+    }
+    """Property value generator per Notion property type."""
 
     def _gen_iso_date(self) -> str:
         return self.faker.date_between("-5y", "today").isoformat()
@@ -233,12 +278,13 @@ class ReferenceGenerator:
         if depth >= max_depth:
             return self.gen_condition(schema)
 
-        p = self.rng.random()
+        # 8 random bits: 128/256 = 0.5, 192/256 = 0.75
+        p = self.rng.getrandbits(8)
 
-        if p < 0.5:
+        if p < 128:
             return self.gen_condition(schema)
 
-        if p < 0.75:
+        if p < 192:
             return {
                 "not": self.gen_filter(schema, depth + 1, max_depth)
             }
@@ -252,7 +298,7 @@ class ReferenceGenerator:
         }
 
     def gen_condition(self, schema: dict) -> dict:
-        prop = self.rng.choice(list(schema))
+        prop = self.rng.choice(self._schema_keys(schema))
         typ = schema[prop]["type"]
         op = self.rng.choice(sorted(self.OPERATORS[typ]))
 
@@ -263,6 +309,18 @@ class ReferenceGenerator:
             typ: {op: val}
         }
 
+    def _schema_keys(self, schema: dict) -> tuple[str, ...]:
+        """Return the property names of ``schema`` as a cached tuple.
+
+        Filters for one schema are generated back to back, so caching the keys
+        of the last schema seen avoids materializing them for every condition.
+        """
+        if schema is not self._keys_schema:
+            self._keys_schema = schema
+            self._keys = tuple(schema)
+
+        return self._keys
+
     def _gen_condition_value(self, typ: str, op: str):
         if typ in ("title", "rich_text"):
             if op == "is_empty":
@@ -348,16 +406,23 @@ class _BaseGenerator(ABC, Generic[T]):
 
     Subclasses decide:
       * how expressions are *emitted* (AST vs Python source)
+
+    Node kind decisions draw 8 random bits per node.
     """
 
+    LEAF_THRESHOLD = 115
+    """Out of 256: probability (~0.45) of emitting a leaf before max depth."""
+
+    NOT_THRESHOLD = 154
+    """Out of 256: cumulative probability (~0.60) of emitting a leaf or a NOT node."""
+
     def __init__(self, seed: int | None = None):
         self.rng = random.Random(seed)
-        self.faker = Faker()
-        if seed is not None:
-            self.faker.seed_instance(seed)
+        self.faker = _shared_faker(seed)
 
         self.metadata = MetaData()
         self.last_generated_table = None
+        self._table_counter = 0
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -395,14 +460,14 @@ class _BaseGenerator(ABC, Generic[T]):
         if depth >= max_depth:
             return self._gen_leaf(columns)
 
-        roll = self.rng.random()
+        roll = self.rng.getrandbits(8)
 
         # Bias toward leaves
-        if roll < 0.45:
+        if roll < self.LEAF_THRESHOLD:
             return self._gen_leaf(columns)
 
         # Unary NOT
-        if roll < 0.60:
+        if roll < self.NOT_THRESHOLD:
             inner = self._gen_expr(table, columns, depth + 1, max_depth)
             return self._emit_not(inner)
 
@@ -433,33 +498,51 @@ class _BaseGenerator(ABC, Generic[T]):
     # ------------------------------------------------------------------
 
     def _gen_literal(self, typ: type_api.TypeEngine) -> Any:
-        if isinstance(typ, type_api.Integer):
-            return self.rng.randint(0, 1000)
+        # _gen_type() only produces the exact classes in the table
+        gen = self._LITERAL_GENERATORS.get(type(typ))
+        if gen is not None:
+            return gen(self)
 
-        if isinstance(typ, type_api.Numeric):
-            return Decimal(f"{self.rng.uniform(0, 1000):.2f}")
+        for cls in type(typ).__mro__[1:]:
+            gen = self._LITERAL_GENERATORS.get(cls)
+            if gen is not None:
+                return gen(self)
 
-        if isinstance(typ, type_api.Money):
-            return Decimal(f"{self.rng.uniform(0, 1000):.2f}")
+        raise TypeError(f"Unsupported type engine: {typ!r}")
 
-        if isinstance(typ, type_api.Boolean):
-            return self.rng.choice([True, False])
+    def _gen_integer_literal(self) -> int:
+        return self.rng.randint(0, 1000)
 
-        if isinstance(typ, type_api.String):
-            return self.faker.first_name()
+    def _gen_decimal_literal(self) -> Decimal:
+        return Decimal(f"{self.rng.uniform(0, 1000):.2f}")
 
-        if isinstance(typ, type_api.Date):
-            d = self.faker.date_between("-10y", "today")
-            return date(d.year, d.month, d.day)
+    def _gen_boolean_literal(self) -> bool:
+        return self.rng.choice([True, False])
 
-        raise TypeError(f"Unsupported type engine: {typ!r}")
+    def _gen_string_literal(self) -> str:
+        return self.faker.first_name()
+
+    def _gen_date_literal(self) -> date:
+        d = self.faker.date_between("-10y", "today")
+        return date(d.year, d.month, d.day)
+
+    _LITERAL_GENERATORS: dict[type, Callable[[_BaseGenerator], Any]] = {
+        type_api.Integer: _gen_integer_literal,
+        type_api.Numeric: _gen_decimal_literal,
+        type_api.Money: _gen_decimal_literal,
+        type_api.Boolean: _gen_boolean_literal,
+        type_api.String: _gen_string_literal,
+        type_api.Date: _gen_date_literal,
+    }
+    """Literal generator per type engine class, resolved along the MRO of the type."""
 
     # ------------------------------------------------------------------
     # Table generation
     # ------------------------------------------------------------------
 
     def _gen_table(self, max_cols: int = 8) -> Table:
-        name = f"table_{self.faker.uuid4()}".replace("-", "_")
+        self._table_counter += 1
+        name = f"table_{self._table_counter:08x}"
 
         cols: list[Column] = []
         for i in range(max_cols - 1):
@@ -531,10 +614,14 @@ class ASTGenerator(_BaseGenerator[ColumnElement]):
 # Python expression generator (exec()-able)
 # ------------------------------------------------------------------------------
 
-class ExpressionGenerator(_BaseGenerator[str]):
+class ExpressionGenerator(_BaseGenerator[Fragments]):
     """
     Generates Python expressions that, when executed,
     produce ColumnElement trees.
+
+    Emission hooks return nested lists of source fragments which are
+    flattened and joined once in :meth:`generate`, so parent nodes never
+    copy the source text of their subtrees.
     """
     INFIX_OPS = {
         Operator.EQ: "==",
@@ -568,28 +655,71 @@ class ExpressionGenerator(_BaseGenerator[str]):
 
         self.bool_style = bool_style
 
-    def _emit_binary(self, column: Column, op: Operator, value: Any) -> str:
-        col = f"{column.parent.name}.c.{column.name}"
+        # Source path ("<table>.c.<column>") of the current table's columns, keyed by id()
+        self._colpath: dict[int, str] = {}
+
+    def generate(self, max_cols: int = 8, max_depth: int = 6) -> str:
+        return self._join(super().generate(max_cols=max_cols, max_depth=max_depth))
+
+    @staticmethod
+    def _join(fragments: Fragments) -> str:
+        parts: list[str] = []
+        stack = [iter(fragments)]
+        while stack:
+            for fragment in stack[-1]:
+                if isinstance(fragment, str):
+                    parts.append(fragment)
+                else:
+                    stack.append(iter(fragment))
+                    break
+            else:
+                stack.pop()
+
+        return "".join(parts)
+
+    def _gen_table(self, max_cols: int = 8) -> Table:
+        table = super()._gen_table(max_cols)
+        # one table per expression: drop the paths of the previous one,
+        # whose column ids may be reused once it is garbage collected
+        self._colpath = {
+            id(column): f"{table.name}.c.{column.name}"
+            for column in table.uc
+        }
+
+        return table
+
+    @staticmethod
+    def _repr_literal(value: Any) -> str:
+        if value is True:
+            return "True"
+        if value is False:
+            return "False"
+        if type(value) is Decimal:
+            return f"Decimal('{value}')"
+        return repr(value)
+
+    def _emit_binary(self, column: Column, op: Operator, value: Any) -> Fragments:
+        col = self._colpath[id(column)]
 
         if op in self.INFIX_OPS:
-            return f"({col} {self.INFIX_OPS[op]} {repr(value)})"
+            return ["(", col, " ", self.INFIX_OPS[op], " ", self._repr_literal(value), ")"]
         
         if op in self.METHOD_OPS:
             if op in (Operator.IS_EMPTY, Operator.IS_NOT_EMPTY):
-                return f"({col}.{self.METHOD_OPS[op]}())"
-            return f"({col}.{self.METHOD_OPS[op]}({repr(value)}))"
+                return ["(", col, ".", self.METHOD_OPS[op], "())"]
+            return ["(", col, ".", self.METHOD_OPS[op], "(", self._repr_literal(value), "))"]
 
         raise ValueError(f"Unsupported operator: {op}")
 
-    def _emit_bool(self, op: BoolOp, left: str, right: str) -> str:
+    def _emit_bool(self, op: BoolOp, left: Fragments, right: Fragments) -> Fragments:
         if self.bool_style == "function":
             fn = "and_" if op == "and" else "or_"
-            return f"{fn}({left}, {right})"
+            return [fn, "(", left, ", ", right, ")"]
 
         symbol = "&" if op == "and" else "|"
-        return f"({left} {symbol} {right})"
+        return ["(", left, " ", symbol, " ", right, ")"]
 
-    def _emit_not(self, expr: str) -> str:
+    def _emit_not(self, expr: Fragments) -> Fragments:
         if self.bool_style == "function":
-            return f"not_({expr})"
-        return f"(~{expr})"
+            return ["not_(", expr, ")"]
+        return ["(~", expr, ")"]